@@ -74,6 +74,11 @@ from .generation import (
     remove_instructions,
     update_instructions,
 )
+from .interruption_config import (
+    TOKENS_ACCEPTABLE,
+    classify_tokens as classify_interruption_tokens,
+    tokenize as tokenize_interruption,
+)
 from .speech_handle import SpeechHandle
 
 if TYPE_CHECKING:
@@ -1191,14 +1196,6 @@ class AgentActivity(RecognitionHooks):
         # ---- BEGIN: intelligent interruption filter (added) ----
         # When there's an active speech handle, consult partial STT and swallow
         # purely-backchannel filler words while the agent is speaking.
-        try:
-            from .interruption_config import IGNORE_WORDS, INTERRUPT_WORDS, FILLER_WORDS
-        except Exception:
-            # fallback defaults (safe)
-            IGNORE_WORDS = {"yeah", "ok", "okay", "hmm", "uh-huh", "right", "yep", "mmhmm"}
-            INTERRUPT_WORDS = {"stop", "wait", "no", "hold", "cancel", "pause"}
-            FILLER_WORDS = {"but", "and", "or", "like", "you know", "so"}
-
         # If there is a current speech that can be interrupted, check the partial transcript.
         if (
             self._current_speech is not None
@@ -1213,11 +1210,8 @@ class AgentActivity(RecognitionHooks):
             except Exception:
                 transcript = ""
 
-            # Tokenize conservatively (strip common punctuation)
-            tokens = [t.strip(".,!?;:()[]\"'") for t in transcript.split() if t.strip()]
-
-            # Filter out empty tokens and articles
-            tokens = [t for t in tokens if t and t not in {"a", "an", "the", "to", "in", "on", "at"}]
+            # Tokenize into known phrases ("hold on", "got it", ...) and single words
+            tokens = tokenize_interruption(transcript)
 
             # If no meaningful tokens yet (no partial STT) -> swallow short VAD blips by default.
             # This avoids audible pauses/stutters when STT hasn't arrived.
@@ -1225,19 +1219,11 @@ class AgentActivity(RecognitionHooks):
                 # Do not interrupt; return early so we don't call existing interrupt logic.
                 return
 
-            # Check for interrupt words first (highest priority)
-            if any(tok in INTERRUPT_WORDS for tok in tokens):
-                # fall through to normal interrupt handling below
-                pass
-            else:
-                # No interrupt words found. Check if all tokens are acceptable passive content
-                # Acceptable = IGNORE_WORDS or FILLER_WORDS
-                acceptable_tokens = IGNORE_WORDS | FILLER_WORDS
-                
-                if all(tok in acceptable_tokens for tok in tokens):
-                    # All tokens are passive/filler - swallow interruption
-                    return
-                # Otherwise fall through to normal interrupt handling
+            # Interrupt words take priority; only purely passive/filler content
+            # (IGNORE_WORDS or FILLER_WORDS) is swallowed
+            if classify_interruption_tokens(tokens) == TOKENS_ACCEPTABLE:
+                return
+            # Otherwise fall through to normal interrupt handling
         # ---- END: intelligent interruption filter (added) ----
 
         # Original behavior: if the agent is speaking and interruptions are allowed, pause/interrupt
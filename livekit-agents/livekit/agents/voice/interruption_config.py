@@ -1,5 +1,3 @@
-
-
 """
 Configuration for intelligent interruption handling in LiveKit agents.
 
@@ -7,32 +5,209 @@ These word lists control how the agent distinguishes between passive acknowledge
 (backchanneling) and active interruptions.
 """
 
+import re
+import sys
+from collections.abc import Iterable, Sequence
+
 # Words that should be ignored when the agent is actively speaking
 # These are typically passive acknowledgements and filler words
-IGNORE_WORDS = {
-    "yeah", "ok", "okay", "hmm", "uh-huh", "right", "yep", "mmhmm",
-    "sure", "understood", "got it", "uh", "um", "ah", "yeah yeah",
-    "absolutely", "definitely", "certainly", "sounds good", "i see",
-    "i know", "i get it", "makes sense", "got ya", "no kidding",
-    "you bet", "for sure", "all right", "alright"
-}
+IGNORE_WORDS = frozenset(
+    map(
+        sys.intern,
+        (
+            "yeah",
+            "ok",
+            "okay",
+            "hmm",
+            "uh-huh",
+            "right",
+            "yep",
+            "mmhmm",
+            "sure",
+            "understood",
+            "got it",
+            "uh",
+            "um",
+            "ah",
+            "yeah yeah",
+            "absolutely",
+            "definitely",
+            "certainly",
+            "sounds good",
+            "i see",
+            "i know",
+            "i get it",
+            "makes sense",
+            "got ya",
+            "no kidding",
+            "you bet",
+            "for sure",
+            "all right",
+            "alright",
+        ),
+    )
+)
 
 # Words that should always trigger an interruption, regardless of context
 # These are typically commands or directive interruptions
-INTERRUPT_WORDS = {
-    "stop", "wait", "no", "hold", "cancel", "pause",
-    "hold on", "wait wait", "one second", "one sec", "just a sec",
-    "hang on", "slow down", "repeat that", "what", "sorry", "excuse me",
-    "never mind", "never", "don't", "don't say that"
-}
+INTERRUPT_WORDS = frozenset(
+    map(
+        sys.intern,
+        (
+            "stop",
+            "wait",
+            "no",
+            "hold",
+            "cancel",
+            "pause",
+            "hold on",
+            "wait wait",
+            "one second",
+            "one sec",
+            "just a sec",
+            "hang on",
+            "slow down",
+            "repeat that",
+            "what",
+            "sorry",
+            "excuse me",
+            "never mind",
+            "never",
+            "don't",
+            "don't say that",
+        ),
+    )
+)
 
 # Filler words that are okay to appear mixed with ignore words
 # These don't trigger interruption by themselves
-FILLER_WORDS = {
-    "but", "and", "or", "like", "you know", "i mean", "actually",
-    "well", "so", "anyway", "basically", "essentially", "practically",
-    "kind of", "sort of", "somehow", "somewhat", "quite", "really",
-    "very", "pretty", "honestly", "seriously", "literally"
+FILLER_WORDS = frozenset(
+    map(
+        sys.intern,
+        (
+            "but",
+            "and",
+            "or",
+            "like",
+            "you know",
+            "i mean",
+            "actually",
+            "well",
+            "so",
+            "anyway",
+            "basically",
+            "essentially",
+            "practically",
+            "kind of",
+            "sort of",
+            "somehow",
+            "somewhat",
+            "quite",
+            "really",
+            "very",
+            "pretty",
+            "honestly",
+            "seriously",
+            "literally",
+        ),
+    )
+)
+
+# Tokens that may make up a swallowed (non-interrupting) utterance
+ACCEPTABLE_WORDS = IGNORE_WORDS | FILLER_WORDS
+
+MICRO_DEBOUNCE_MS = 150
+
+# Result of classify_tokens, in increasing priority
+TOKENS_ACCEPTABLE = 0  # only ignore/filler words -> swallow while the agent is speaking
+TOKENS_MIXED = 1  # contains words from neither list
+TOKENS_INTERRUPT = 2  # contains at least one interrupt word
+
+_WORD_CLASS = {
+    **dict.fromkeys(ACCEPTABLE_WORDS, TOKENS_ACCEPTABLE),
+    **dict.fromkeys(INTERRUPT_WORDS, TOKENS_INTERRUPT),
 }
 
-MICRO_DEBOUNCE_MS = 150
\ No newline at end of file
+# Tokenizer for partial transcripts: whitespace and punctuation separate tokens, every
+# other character (any script, digits, symbols) is kept so unknown input still counts as
+# a word. Apostrophes/hyphens are only allowed inside a token ("uh-huh", "don't"), so
+# quotes around a word are dropped. The two character classes are disjoint, which keeps
+# the pattern free of backtracking.
+_SEPARATORS = r"\s.,!?;:()\[\]{}\"\u00a1\u00bf\u2026\u201c\u201d\u201e\u00ab\u00bb\u2013\u2014"
+_TOKEN_RE = re.compile(rf"[^{_SEPARATORS}'\-]+(?:['\-]+[^{_SEPARATORS}'\-]+)*")
+# Phrases never span sentence punctuation; commas are crossed ("just, a sec")
+_SENTENCE_BREAK_RE = re.compile(r"[.!?;:\u2026]+")
+_STOPWORDS = frozenset({"a", "an", "the", "to", "in", "on", "at"})
+# STT engines often emit typographic apostrophes ("don\u2019t"); fold them in one C-level pass
+_APOSTROPHE_TABLE = str.maketrans({"\u2018": "'", "\u2019": "'", "\u02bc": "'"})
+
+# Multi-word phrases are matched greedily (longest first) before stopwords are dropped,
+# so entries like "hold on" or "just a sec" are seen as a single token. Each phrase maps
+# to its interned vocabulary string, so an emitted phrase token is that same object and
+# later set/dict lookups succeed on the identity check (single-word tokens come straight
+# from the regex and are not interned).
+_MULTI_WORD_PHRASES = {p: p for p in IGNORE_WORDS | INTERRUPT_WORDS | FILLER_WORDS if " " in p}
+
+
+def _build_phrase_lengths(phrases: Iterable[str]) -> dict[str, tuple[int, ...]]:
+    """Index phrases by first word -> candidate lengths (longest first).
+
+    This acts as a one-level trie: words that cannot start a phrase skip the
+    join/lookup entirely.
+    """
+    lengths: dict[str, set[int]] = {}
+    for phrase in phrases:
+        first, _, _ = phrase.partition(" ")
+        lengths.setdefault(first, set()).add(phrase.count(" ") + 1)
+    return {first: tuple(sorted(sizes, reverse=True)) for first, sizes in lengths.items()}
+
+
+_PHRASE_LENGTHS = _build_phrase_lengths(_MULTI_WORD_PHRASES)
+
+
+def _append_words(words: Sequence[str], tokens: list[str]) -> None:
+    i, n = 0, len(words)
+    while i < n:
+        for size in _PHRASE_LENGTHS.get(words[i], ()):
+            if i + size > n:
+                continue
+            phrase = _MULTI_WORD_PHRASES.get(" ".join(words[i : i + size]))
+            if phrase is not None:
+                tokens.append(phrase)
+                i += size
+                break
+        else:
+            if words[i] not in _STOPWORDS:
+                tokens.append(words[i])
+            i += 1
+
+
+def tokenize(transcript: str) -> list[str]:
+    """Split a transcript into known phrases and single words, dropping articles.
+
+    Phrases are only merged within a sentence: "No. Kidding." stays ``["no", "kidding"]``
+    and interrupts, while "no kidding" is a single acceptable phrase.
+    """
+    text = transcript.lower().translate(_APOSTROPHE_TABLE)
+    tokens: list[str] = []
+    for sentence in _SENTENCE_BREAK_RE.split(text):
+        _append_words(_TOKEN_RE.findall(sentence), tokens)
+
+    return tokens
+
+
+def classify_tokens(tokens: Sequence[str]) -> int:
+    """Classify tokens from `tokenize` with one lookup per token.
+
+    Returns TOKENS_INTERRUPT as soon as an interrupt word is seen, TOKENS_MIXED if any
+    token is unknown, TOKENS_ACCEPTABLE otherwise.
+    """
+    result = TOKENS_ACCEPTABLE
+    for tok in tokens:
+        cls = _WORD_CLASS.get(tok, TOKENS_MIXED)
+        if cls == TOKENS_INTERRUPT:
+            return TOKENS_INTERRUPT
+        if cls > result:
+            result = cls
+
+    return result
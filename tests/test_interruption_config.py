@@ -0,0 +1,67 @@
+import pytest
+
+from livekit.agents.voice.interruption_config import (
+    TOKENS_ACCEPTABLE,
+    TOKENS_INTERRUPT,
+    TOKENS_MIXED,
+    classify_tokens,
+    tokenize,
+)
+
+
+@pytest.mark.parametrize(
+    "transcript, expected",
+    [
+        ("", []),
+        ("yeah", ["yeah"]),
+        ("Yeah, okay.", ["yeah", "okay"]),
+        ("Hold on, wait", ["hold on", "wait"]),
+        ("no kidding", ["no kidding"]),
+        ("uh-huh", ["uh-huh"]),
+        ("say 'yeah' to the robot", ["say", "yeah", "robot"]),
+        ('"yeah"', ["yeah"]),
+        # stopwords inside a known phrase are kept as part of the phrase
+        ("just a sec", ["just a sec"]),
+        ("Just, a sec!", ["just a sec"]),
+        # typographic apostrophes are folded before matching
+        ("don’t stop", ["don't", "stop"]),
+        ("donʼt", ["don't"]),
+        # phrases never span sentence punctuation
+        ("No. Kidding.", ["no", "kidding"]),
+        ("no… kidding", ["no", "kidding"]),
+        ("Got. It.", ["got", "it"]),
+        # digits and non-Latin scripts are kept as unknown words
+        ("123", ["123"]),
+        ("नमस्ते", ["नमस्ते"]),
+        ("你好", ["你好"]),
+        ("café", ["café"]),
+    ],
+)
+def test_tokenize(transcript: str, expected: list[str]):
+    assert tokenize(transcript) == expected
+
+
+@pytest.mark.parametrize(
+    "transcript, expected",
+    [
+        ("", TOKENS_ACCEPTABLE),
+        ("yeah okay uh-huh", TOKENS_ACCEPTABLE),
+        ("no kidding", TOKENS_ACCEPTABLE),
+        ("No. Kidding.", TOKENS_INTERRUPT),
+        ("just a sec", TOKENS_INTERRUPT),
+        ("yeah but wait", TOKENS_INTERRUPT),
+        ("don’t", TOKENS_INTERRUPT),
+        ("yeah tell me more", TOKENS_MIXED),
+        ("123", TOKENS_MIXED),
+        ("नमस्ते", TOKENS_MIXED),
+        ("你好", TOKENS_MIXED),
+    ],
+)
+def test_classify_tokens(transcript: str, expected: int):
+    assert classify_tokens(tokenize(transcript)) == expected
+
+
+def test_classify_tokens_interrupt_wins_over_unknown():
+    assert classify_tokens(["hello", "stop"]) == TOKENS_INTERRUPT
+    assert classify_tokens(["hello", "yeah"]) == TOKENS_MIXED
+    assert classify_tokens(("yeah", "okay")) == TOKENS_ACCEPTABLE